@@ -61,42 +61,46 @@ WEBPODA_TOKEN : This is the token used to authenticate with the webpoda API.
 
 # NOTE: ialirt and spacecraft aren't actual instruments, but they are
 #       additional data sources for packet definitions and processing
-VALID_INSTRUMENTS = {
-    "codice",
-    "glows",
-    "hit",
-    "hi",
-    "ialirt",
-    "idex",
-    "lo",
-    "mag",
-    "spacecraft",
-    "swapi",
-    "swe",
-    "ultra",
-}
+VALID_INSTRUMENTS = frozenset(
+    {
+        "codice",
+        "glows",
+        "hit",
+        "hi",
+        "ialirt",
+        "idex",
+        "lo",
+        "mag",
+        "spacecraft",
+        "swapi",
+        "swe",
+        "ultra",
+    }
+)
 
-VALID_DATALEVELS = {
-    "l0",
-    "l1",
-    "l1a",
-    "l1b",
-    "l1c",
-    "l1ca",
-    "l1cb",
-    "l1d",
-    "l2",
-    "l2a",
-    "l2b",
-    "l3",
-    "l3a",
-    "l3b",
-    "l3c",
-    "l3d",
-    "l3e",
-}
+VALID_DATALEVELS = frozenset(
+    {
+        "l0",
+        "l1",
+        "l1a",
+        "l1b",
+        "l1c",
+        "l1ca",
+        "l1cb",
+        "l1d",
+        "l2",
+        "l2a",
+        "l2b",
+        "l3",
+        "l3a",
+        "l3b",
+        "l3c",
+        "l3d",
+        "l3e",
+    }
+)
 
-VALID_FILE_EXTENSION = {"pkts", "cdf"}
+VALID_FILE_EXTENSION = frozenset({"pkts", "cdf"})
 
 FILENAME_CONVENTION = (
     "<mission>_<instrument>_<datalevel>_<descriptor>_"
@@ -108,4 +112,4 @@ ANCILLARY_FILENAME_CONVENTION = (
     "<start_date>(_<end_date>)_<version>.<extension>"
 )
 
-VALID_ANCILLARY_FILE_EXTENSION = {"cdf", "csv", "dat", "json", "zip"}
+VALID_ANCILLARY_FILE_EXTENSION = frozenset({"cdf", "csv", "dat", "json", "zip"})
@@ -3,13 +3,46 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
+import sys
 from abc import abstractmethod
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import ClassVar
 
 import imap_data_access
 
+# Filename patterns are compiled once at import time rather than on every call.
+# The extension is matched structurally here and checked against the configured
+# valid extensions afterwards, since those are defined after this module is imported.
+_SCIENCE_RE = re.compile(
+    r"(?P<mission>imap)_"
+    r"(?P<instrument>[^_]+)_"
+    r"(?P<data_level>[^_]+)_"
+    r"(?P<descriptor>[^_]+)_"
+    r"(?P<start_date>\d{8})"
+    r"(-repoint(?P<repointing>\d{5}))?"  # Optional repointing field
+    r"_(?P<version>v\d{3})"
+    r"\.(?P<extension>[^.]+)\Z"
+)
+_ANCILLARY_RE = re.compile(
+    r"(?P<mission>imap)_"
+    r"(?P<instrument>[^_]+)_"
+    r"(?P<descriptor>[^_]+)_"
+    r"(?P<start_date>\d{8})"
+    r"(_(?P<end_date>\d{8}))?"  # Optional end_date
+    r"_(?P<version>v\d{3})"
+    r"\.(?P<extension>[^.]+)\Z"
+)
+_VERSION_FULLMATCH = re.compile(r"v\d{3}").fullmatch
+_REPOINTING_RE = re.compile(r"repoint\d{5}")
+
+# Days per month for a non-leap year, used for date validation
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 
 def generate_imap_file_path(filename: str) -> ImapFilePath:
     """Generate an ImapFilePath object from a filename.
@@ -26,26 +59,203 @@ def generate_imap_file_path(filename: str) -> ImapFilePath:
     -------
     A FilePath object
     """
-    try:
-        # SPICE
-        path_obj = imap_data_access.SPICEFilePath(filename)
-    except SPICEFilePath.InvalidSPICEFileError:
-        # Science and Ancillary
+    # Guess the most likely file type from the name so that valid files are
+    # usually parsed on the first attempt without raising. Any other file types are
+    # then tried in the usual SPICE, Science, Ancillary order.
+    name = _basename(filename)
+    is_spice_name = imap_data_access.SPICEFilePath._probe_match(name) is not None
+    if is_spice_name:
+        preferred = imap_data_access.SPICEFilePath
+    elif (
+        name.startswith("imap_")
+        and name.rpartition(".")[2] in imap_data_access.VALID_FILE_EXTENSION
+    ):
+        preferred = imap_data_access.ScienceFilePath
+    else:
+        preferred = imap_data_access.AncillaryFilePath
+
+    path_classes = (
+        imap_data_access.SPICEFilePath,
+        imap_data_access.ScienceFilePath,
+        imap_data_access.AncillaryFilePath,
+    )
+    ancillary_error = None
+    for path_class in (preferred, *(c for c in path_classes if c is not preferred)):
+        if path_class is imap_data_access.SPICEFilePath and not is_spice_name:
+            # No SPICE pattern matches, so don't build an object just to fail
+            continue
         try:
-            path_obj = imap_data_access.ScienceFilePath(filename)
-        except ScienceFilePath.InvalidScienceFileError:
-            # If Science file fails, then process as an Ancillary file
-            try:
-                path_obj = imap_data_access.AncillaryFilePath(filename)
-            except AncillaryFilePath.InvalidAncillaryFileError as e:
-                # Matches neither file format
-                error_message = (
-                    f"Invalid file type for {filename}. It does not match"
-                    f"Spice, Science or Ancillary file formats"
-                )
-                raise ValueError(error_message) from e
+            return path_class(filename)
+        except _INVALID_FILE_ERRORS as e:
+            # Ancillary is the final fallback format, so whatever order the classes
+            # were tried in, its error is the one reported as the cause
+            if path_class is imap_data_access.AncillaryFilePath:
+                ancillary_error = e
+
+    # Matches neither file format
+    error_message = (
+        f"Invalid file type for {filename}. It does not match"
+        f"Spice, Science or Ancillary file formats"
+    )
+    raise ValueError(error_message) from ancillary_error
+
+
+def _basename(filename: str | os.PathLike) -> str:
+    """Get the final component of a file path.
+
+    String splitting is much cheaper than building a Path just to read its name.
+    Both forward and back slashes are treated as separators.
+
+    Parameters
+    ----------
+    filename : str | os.PathLike
+        A filename or file path.
+
+    Returns
+    -------
+    str
+        The filename without any parent directories.
+    """
+    filename = os.fspath(filename)
+    return filename[max(filename.rfind("/"), filename.rfind("\\")) + 1 :]
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_parse(parse: Callable[[str], dict], filename: str) -> dict:
+    """Call a filename parser, caching the result for each parser and name.
+
+    The returned dictionary is shared between calls and must not be modified.
+
+    Parameters
+    ----------
+    parse : Callable[[str], dict]
+        Function parsing a filename into its components.
+    filename : str
+        The name of the file, without any parent directories.
+
+    Returns
+    -------
+    components : dict
+        Dictionary containing components.
+    """
+    return parse(filename)
+
+
+def _cached_components(parse: Callable[[str], dict], filename: str | Path) -> dict:
+    """Parse the components of a filename, reusing earlier results for the same name.
+
+    Parsing only depends on the name, and the same names are often seen many times
+    when handling large batches of files, so the parsed components are cached. A copy
+    is returned so callers can modify the components without affecting the cache.
+
+    Parameters
+    ----------
+    parse : Callable[[str], dict]
+        Function parsing a filename, without parent directories, into its
+        components. It should raise if the filename is invalid.
+    filename : str | Path
+        A filename or file path.
+
+    Returns
+    -------
+    components : dict
+        Dictionary containing components.
+    """
+    return dict(_cached_parse(parse, _basename(filename)))
+
+
+def _is_leap_year(year: int) -> bool:
+    """Check whether a year is a leap year in the Gregorian calendar.
+
+    Parameters
+    ----------
+    year : int
+        The year to check.
+
+    Returns
+    -------
+    bool
+        Whether the year is a leap year.
+    """
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
 
-    return path_obj
+def _calendar_valid(yyyymmdd: str) -> bool:
+    """Check that an 8 digit YYYYMMDD string is a real calendar date.
+
+    The string is assumed to already be 8 digits. Use ``ImapFilePath.is_valid_date``
+    for arbitrary input.
+
+    Parameters
+    ----------
+    yyyymmdd : str
+        Date in YYYYMMDD format.
+
+    Returns
+    -------
+    bool
+        Whether the date exists.
+    """
+    year = int(yyyymmdd[:4])
+    month = int(yyyymmdd[4:6])
+    day = int(yyyymmdd[6:])
+    if year < 1 or not 1 <= month <= 12:
+        return False
+    if month == 2 and _is_leap_year(year):
+        return 1 <= day <= 29
+    return 1 <= day <= _DAYS_IN_MONTH[month - 1]
+
+
+def _parse_yyyymmdd(yyyymmdd: str) -> datetime:
+    """Parse an 8 digit YYYYMMDD date string.
+
+    The fields are converted with int() directly, which is much faster than
+    strptime for a fixed-width format.
+
+    Parameters
+    ----------
+    yyyymmdd : str
+        Date in YYYYMMDD format.
+
+    Returns
+    -------
+    datetime
+        The parsed date.
+
+    Raises
+    ------
+    ValueError
+        If the date does not exist.
+    """
+    return datetime(int(yyyymmdd[:4]), int(yyyymmdd[4:6]), int(yyyymmdd[6:]))
+
+
+def _parse_year_doy(year_doy: str) -> datetime:
+    """Parse a YYYY_DOY date string.
+
+    Unlike strptime, a day of year of 366 is rejected in non-leap years rather than
+    rolling over into the next year.
+
+    Parameters
+    ----------
+    year_doy : str
+        Date in YYYY_DOY format, where DOY is the 3 digit day of the year.
+
+    Returns
+    -------
+    datetime
+        The parsed date.
+
+    Raises
+    ------
+    ValueError
+        If the date does not exist.
+    """
+    year = int(year_doy[:4])
+    doy = int(year_doy[5:])
+    if not 1 <= doy <= (366 if _is_leap_year(year) else 365):
+        raise ValueError(f"Invalid day of year {doy} for year {year}")
+    return datetime(year, 1, 1) + timedelta(days=doy - 1)
 
 
 class ImapFilePath:
@@ -55,6 +265,9 @@ class ImapFilePath:
     AncillaryFilePath, and SPICEFilePath.
     """
 
+    # Slots keep instances small, which matters when handling many files at once
+    __slots__ = ("_filename",)
+
     @staticmethod
     def is_valid_date(input_date: str) -> bool:
         """Check input date string is in valid format and is correct date.
@@ -69,14 +282,11 @@ class ImapFilePath:
         bool
             Whether date input is valid or not
         """
-        # Validate if it's a real date
-        try:
-            # This checks if date is in YYYYMMDD format.
-            # Sometimes, date is correct but not in the format we want
-            datetime.strptime(input_date, "%Y%m%d")
-            return True
-        except ValueError:
+        # Check the fixed-width YYYYMMDD format directly rather than going through
+        # datetime.strptime, which is comparatively slow and allocates a datetime
+        if len(input_date) != 8 or not (input_date.isascii() and input_date.isdigit()):
             return False
+        return _calendar_valid(input_date)
 
     @staticmethod
     def is_valid_version(input_version: str) -> bool:
@@ -92,7 +302,22 @@ class ImapFilePath:
         bool
             Whether input version is valid or not.
         """
-        return input_version == "latest" or re.fullmatch(r"v\d{3}", input_version)
+        return input_version == "latest" or bool(_VERSION_FULLMATCH(input_version))
+
+    @property
+    def filename(self) -> Path:
+        """The filename or file path this instance was created with, as a Path.
+
+        The Path is only built when first accessed, since parsing and validating a
+        filename only needs the string.
+        """
+        if not isinstance(self._filename, Path):
+            self._filename = Path(self._filename)
+        return self._filename
+
+    @filename.setter
+    def filename(self, filename: str | Path) -> None:
+        self._filename = filename
 
     @abstractmethod
     def construct_path(self) -> Path:
@@ -103,6 +328,19 @@ class ImapFilePath:
 class ScienceFilePath(ImapFilePath):
     """Class for building and validating filepaths for science files."""
 
+    __slots__ = (
+        "data_dir",
+        "data_level",
+        "descriptor",
+        "error_message",
+        "extension",
+        "instrument",
+        "mission",
+        "repointing",
+        "start_date",
+        "version",
+    )
+
     class InvalidScienceFileError(Exception):
         """Indicates a bad file type."""
 
@@ -135,11 +373,11 @@ class ScienceFilePath(ImapFilePath):
         filename : str | Path
             Science data filename or file path.
         """
-        self.filename = Path(filename)
+        self._filename = filename
         self.data_dir = imap_data_access.config["DATA_DIR"]
 
         try:
-            split_filename = self.extract_filename_components(self.filename)
+            split_filename = self.extract_filename_components(filename)
         except ValueError as err:
             raise self.InvalidScienceFileError(
                 f"Invalid filename. Expected file to match format: "
@@ -228,56 +466,53 @@ class ScienceFilePath(ImapFilePath):
             Error message for specific missing attribute, or "" if the file name is
             valid.
         """
-        error_message = ""
-
-        if any(
-            attr is None or attr == ""
-            for attr in [
-                self.mission,
-                self.instrument,
-                self.data_level,
-                self.descriptor,
-                self.start_date,
-                self.version,
-                self.extension,
-            ]
+        errors = []
+
+        if not (
+            self.mission
+            and self.instrument
+            and self.data_level
+            and self.descriptor
+            and self.start_date
+            and self.version
+            and self.extension
         ):
-            error_message = (
+            errors.append(
                 f"Invalid filename, missing attribute. Filename "
                 f"convention is {imap_data_access.FILENAME_CONVENTION} \n"
             )
         if self.mission != "imap":
-            error_message += f"Invalid mission {self.mission}. Please use imap \n"
+            errors.append(f"Invalid mission {self.mission}. Please use imap \n")
 
         if self.instrument not in imap_data_access.VALID_INSTRUMENTS:
-            error_message += (
+            errors.append(
                 f"Invalid instrument {self.instrument}. Please choose "
                 f"from "
-                f"{imap_data_access.VALID_INSTRUMENTS} \n"
+                f"{sorted(imap_data_access.VALID_INSTRUMENTS)} \n"
             )
         if self.data_level not in imap_data_access.VALID_DATALEVELS:
-            error_message += (
+            errors.append(
                 f"Invalid data level {self.data_level}. Please choose "
                 f"from "
-                f"{imap_data_access.VALID_DATALEVELS} \n"
+                f"{sorted(imap_data_access.VALID_DATALEVELS)} \n"
             )
         if not self.is_valid_date(self.start_date):
-            error_message += "Invalid start date format. Please use YYYYMMDD format. \n"
-        if not bool(re.match(r"^v\d{3}$", self.version)):
-            error_message += "Invalid version format. Please use vXXX format. \n"
+            errors.append("Invalid start date format. Please use YYYYMMDD format. \n")
+        if not _VERSION_FULLMATCH(self.version):
+            errors.append("Invalid version format. Please use vXXX format. \n")
         if self.repointing and not isinstance(self.repointing, int):
-            error_message += "The repointing number should be an integer.\n"
+            errors.append("The repointing number should be an integer.\n")
 
         if self.extension not in imap_data_access.VALID_FILE_EXTENSION or (
             (self.data_level == "l0" and self.extension != "pkts")
             or (self.data_level != "l0" and self.extension != "cdf")
         ):
-            error_message += (
+            errors.append(
                 "Invalid extension. Extension should be pkts for data "
                 "level l0 and cdf for data level higher than l0 \n"
             )
 
-        return error_message
+        return "".join(errors)
 
     def construct_path(self) -> Path:
         """Construct valid path from class variables and data_dir.
@@ -292,14 +527,16 @@ class ScienceFilePath(ImapFilePath):
         Path
             Upload path
         """
-        upload_path = Path(
+        # Format the whole path and parse it once, which is cheaper than joining
+        # each part onto a Path. Only the name of the file is used, even if it was
+        # given with parent directories.
+        upload_path = (
             f"{self.mission}/{self.instrument}/{self.data_level}/"
-            f"{self.start_date[:4]}/{self.start_date[4:6]}/{self.filename}"
+            f"{self.start_date[:4]}/{self.start_date[4:6]}/{_basename(self._filename)}"
         )
         if self.data_dir:
-            upload_path = self.data_dir / upload_path
-
-        return upload_path
+            return Path(self.data_dir, upload_path)
+        return Path(upload_path)
 
     @staticmethod
     def extract_filename_components(filename: str | Path) -> dict:
@@ -323,22 +560,29 @@ class ScienceFilePath(ImapFilePath):
         components : dict
             Dictionary containing components.
         """
-        # Pipe these together for optional matching in the regex below
-        extension_regex = "|".join(imap_data_access.VALID_FILE_EXTENSION)
-        pattern = (
-            r"^(?P<mission>imap)_"
-            r"(?P<instrument>[^_]+)_"
-            r"(?P<data_level>[^_]+)_"
-            r"(?P<descriptor>[^_]+)_"
-            r"(?P<start_date>\d{8})"
-            r"(-repoint(?P<repointing>\d{5}))?"  # Optional repointing field
-            r"_(?P<version>v\d{3})"
-            rf"\.(?P<extension>{extension_regex})$"
-        )
-        if isinstance(filename, Path):
-            filename = filename.name
+        return _cached_components(ScienceFilePath._parse_filename_components, filename)
 
-        match = re.match(pattern, filename)
+    @staticmethod
+    def _parse_filename_components(filename: str) -> dict:
+        """Parse the components of a filename.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file, without any parent directories.
+
+        Returns
+        -------
+        components : dict
+            Dictionary containing components.
+        """
+        # Cheap string checks rule out most other files before running the regex
+        match = None
+        if (
+            filename.startswith("imap_")
+            and filename.rpartition(".")[2] in imap_data_access.VALID_FILE_EXTENSION
+        ):
+            match = _SCIENCE_RE.match(filename)
         if match is None:
             raise ScienceFilePath.InvalidScienceFileError(
                 f"Filename {filename} does not match expected pattern: "
@@ -346,6 +590,10 @@ class ScienceFilePath(ImapFilePath):
             )
 
         components = match.groupdict()
+        # Interned so that comparisons against the valid values and between files
+        # can short-circuit on identity
+        components["instrument"] = sys.intern(components["instrument"])
+        components["data_level"] = sys.intern(components["data_level"])
         if components["repointing"]:
             # We want the repointing number as an integer
             components["repointing"] = int(components["repointing"])
@@ -365,7 +613,7 @@ class ScienceFilePath(ImapFilePath):
         bool
             Whether input repointing is valid or not.
         """
-        return re.fullmatch(r"repoint\d{5}", str(input_repointing))
+        return _REPOINTING_RE.fullmatch(str(input_repointing))
 
 
 # Transform the suffix to the directory structure we are using
@@ -429,27 +677,89 @@ https://naif.jpl.nasa.gov/pub/naif/toolkit_docs/C/req/kernel.html
 """
 
 
+def _combine_spice_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern, dict]:
+    """Fuse SPICE filename patterns into a single alternation regex.
+
+    Named groups must be unique within a pattern, so every group in branch ``i`` is
+    renamed to ``b<i>_<name>`` and the whole branch is wrapped in a ``b<i>`` group.
+    Alternatives are tried in order, so the first pattern that matches the whole
+    filename wins, exactly as if each pattern were tried one after the other.
+
+    Parameters
+    ----------
+    patterns : tuple[str, ...]
+        The individual SPICE filename patterns, in priority order.
+
+    Returns
+    -------
+    combined_regex, branch_groups : tuple[re.Pattern, dict]
+        The compiled alternation, and a mapping of each branch group name to the
+        ``(prefixed_name, name)`` pairs of the named groups in that branch.
+    """
+    branches = []
+    branch_groups = {}
+    for i, pattern in enumerate(patterns):
+        prefix = f"b{i}"
+        names = re.findall(r"\(\?P<(\w+)>", pattern)
+        branch_groups[prefix] = [(f"{prefix}_{name}", name) for name in names]
+        branches.append(
+            f"(?P<{prefix}>" + re.sub(r"\(\?P<", f"(?P<{prefix}_", pattern) + ")"
+        )
+    # Anchor the end so a pattern has to consume the whole filename to match,
+    # which also stops the engine from accepting names with trailing junk
+    return re.compile("(?:" + "|".join(branches) + r")\Z"), branch_groups
+
+
+def _combine_spice_patterns_by_extension(
+    patterns: tuple[tuple[str, tuple[str, ...]], ...],
+) -> dict[str, tuple[re.Pattern, dict]]:
+    """Build a combined SPICE regex for each file extension.
+
+    Parameters
+    ----------
+    patterns : tuple[tuple[str, tuple[str, ...]], ...]
+        Pairs of a SPICE filename pattern and the extensions it can match, in
+        priority order.
+
+    Returns
+    -------
+    regexes : dict[str, tuple[re.Pattern, dict]]
+        The result of ``_combine_spice_patterns`` for each extension, built from the
+        patterns for that extension in the same priority order.
+    """
+    patterns_by_extension = {}
+    for pattern, extensions in patterns:
+        for extension in extensions:
+            patterns_by_extension.setdefault(extension, []).append(pattern)
+    return {
+        extension: _combine_spice_patterns(tuple(extension_patterns))
+        for extension, extension_patterns in patterns_by_extension.items()
+    }
+
+
 class SPICEFilePath(ImapFilePath):
     """Class for building and validating filepaths for SPICE files."""
 
+    __slots__ = ("spice_metadata",)
+
     # Covers:
     # Historical Attitude (type: ah.bc)
     # Predicted Attitude (type: ap.bc)
     # Spin Files (type: spin.csv)
     attitude_file_pattern = (
         r"(imap)_"
-        r"(?P<start_year_doy>[\d]{4}_[\d]{3})_"
-        r"(?P<end_year_doy>[\d]{4}_[\d]{3})_"
-        r"(?P<version>[\d]+)\."
-        r"(?P<type>ah.bc|ap.bc|spin.csv)"
+        r"(?P<start_year_doy>\d{4}_\d{3})_"
+        r"(?P<end_year_doy>\d{4}_\d{3})_"
+        r"(?P<version>\d+)\."
+        r"(?P<type>a[hp]\.bc|spin\.csv)"
     )
     # Covers:
     # Repoint Files (type: repoint.csv)
     repoint_file_pattern = (
         r"(imap)_"
-        r"(?P<end_year_doy>[\d]{4}_[\d]{3})_"
-        r"(?P<version>[\d]+)\."
-        r"(?P<type>repoint.csv)"
+        r"(?P<end_year_doy>\d{4}_\d{3})_"
+        r"(?P<version>\d+)\."
+        r"(?P<type>repoint\.csv)"
     )
     # Covers:
     # Reconstructed (type: recon)
@@ -461,9 +771,9 @@ class SPICEFilePath(ImapFilePath):
     spacecraft_ephemeris_file_pattern = (
         r"(imap)_"
         r"(?P<type>[a-zA-Z0-9\-]+)_"
-        r"(?P<start_date>[\d]{8})_"
-        r"(?P<end_date>[\d]{8})"
-        r"(?:|_v(?P<version>[\d]*))\."
+        r"(?P<start_date>\d{8})_"
+        r"(?P<end_date>\d{8})"
+        r"(?:_v(?P<version>\d*))?\."
         r"(?P<extension>bsp)"
     )
     # Covers:
@@ -473,21 +783,21 @@ class SPICEFilePath(ImapFilePath):
     # Spacecraft clock kernel (type: "imap_sclk_")
     spice_prod_ver_pattern = (
         r"(?P<type>[a-zA-Z\-_]+)"
-        r"(?P<version>[\d]+)\."
+        r"(?P<version>\d+)\."
         r"(?P<extension>tls|tpc|bsp|tsc)"
     )
 
     # Covers:
     # Frame: (type: 'tf')
-    spice_frame_pattern = r"(imap)_(?P<version>[\d]+)\.(?P<type>tf)"
+    spice_frame_pattern = r"(imap)_(?P<version>\d+)\.(?P<type>tf)"
 
     # Covers:
     # Thruster files (type: sff)
     sff_filename_pattern = (
         r"(imap)_"
-        r"(?P<start_year_doy>[\d]{4}_[\d]{3})_"
+        r"(?P<start_year_doy>\d{4}_\d{3})_"
         r"([a-zA-Z0-9\-_]+)_"
-        r"(?P<version>[\d]{2})\."
+        r"(?P<version>\d{2})\."
         r"(?P<type>sff)"
     )
 
@@ -495,8 +805,8 @@ class SPICEFilePath(ImapFilePath):
     # SDC generated metakernels (type: 'tm')
     sdc_mk_filename_pattern = (
         r"(imap)_sdc_metakernel_"
-        r"(?P<start_year>[\d]{4})_"
-        r"v(?P<version>[\d]{3})\."
+        r"(?P<start_year>\d{4})_"
+        r"v(?P<version>\d{3})\."
         r"(?P<type>tm)"
     )
 
@@ -515,16 +825,30 @@ class SPICEFilePath(ImapFilePath):
         r"(?P<type>mk)"
     )
 
-    valid_spice_regexes = (
-        re.compile(attitude_file_pattern),
-        re.compile(repoint_file_pattern),
-        re.compile(spacecraft_ephemeris_file_pattern),
-        re.compile(spice_prod_ver_pattern),
-        re.compile(spice_frame_pattern),
-        re.compile(sff_filename_pattern),
-        re.compile(sdc_mk_filename_pattern),
-        re.compile(attitude_mk_filename_pattern),
-        re.compile(ephemeris_mk_filename_pattern),
+    # Every SPICE filename pattern in priority order, with the file extensions it can
+    # match. This is the only list of patterns: the regexes used for matching and
+    # valid_spice_regexes are both built from it.
+    _spice_patterns: ClassVar[tuple[tuple[str, tuple[str, ...]], ...]] = (
+        (attitude_file_pattern, ("bc", "csv")),
+        (repoint_file_pattern, ("csv",)),
+        (spacecraft_ephemeris_file_pattern, ("bsp",)),
+        (spice_prod_ver_pattern, ("tls", "tpc", "bsp", "tsc")),
+        (spice_frame_pattern, ("tf",)),
+        (sff_filename_pattern, ("sff",)),
+        (sdc_mk_filename_pattern, ("tm",)),
+        (attitude_mk_filename_pattern, ("mk",)),
+        (ephemeris_mk_filename_pattern, ("mk",)),
+    )
+
+    # Anchored at the end, the same as the combined regexes used for matching
+    valid_spice_regexes = tuple(
+        re.compile(pattern + r"\Z") for pattern, _ in _spice_patterns
+    )
+
+    # The extension narrows down which patterns can possibly match, so each
+    # extension gets its own combined regex of just those patterns, in priority order
+    _spice_regexes_by_extension: ClassVar[dict[str, tuple[re.Pattern, dict]]] = (
+        _combine_spice_patterns_by_extension(_spice_patterns)
     )
 
     class InvalidSPICEFileError(Exception):
@@ -546,8 +870,8 @@ class SPICEFilePath(ImapFilePath):
         filename : str | Path
             SPICE data filename or file path.
         """
-        self.filename = Path(filename)
-        self.spice_metadata = SPICEFilePath.extract_filename_components(self.filename)
+        self._filename = filename
+        self.spice_metadata = SPICEFilePath.extract_filename_components(filename)
 
     def construct_path(self) -> Path:
         """Construct valid path from the class variables and data_dir.
@@ -560,11 +884,13 @@ class SPICEFilePath(ImapFilePath):
         Path
             Upload path
         """
-        spice_dir = imap_data_access.config["DATA_DIR"] / "imap/spice"
         subdir = _SPICE_DIR_MAPPING[self.spice_metadata["type"]]
         # Use the file suffix to determine the directory structure
         # IMAP_DATA_DIR/spice/<subdir>/filename
-        return spice_dir / subdir / self.filename
+        return Path(
+            imap_data_access.config["DATA_DIR"],
+            f"imap/spice/{subdir}/{_basename(self._filename)}",
+        )
 
     @staticmethod
     def _spice_parts_handler(components):
@@ -581,7 +907,8 @@ class SPICEFilePath(ImapFilePath):
             Dictionary containing components, validated and transformed.
             If
         """
-        if components["type"] not in _SPICE_TYPE_MAPPING:
+        spice_type = _SPICE_TYPE_MAPPING.get(components["type"])
+        if spice_type is None:
             raise SPICEFilePath.InvalidSPICEFileError(
                 f"Invalid SPICE file. Expected file to have one of the following "
                 f"file types {list(_SPICE_DIR_MAPPING.keys())}. Please reference "
@@ -589,25 +916,19 @@ class SPICEFilePath(ImapFilePath):
                 f"proper naming convention."
             )
 
-        components["type"] = _SPICE_TYPE_MAPPING[components["type"]]
+        components["type"] = spice_type
 
         try:
             if "start_date" in components:  # Convert to datetime
-                components["start_date"] = datetime.strptime(
-                    components["start_date"], "%Y%m%d"
-                )
+                components["start_date"] = _parse_yyyymmdd(components["start_date"])
             if "end_date" in components:
-                components["end_date"] = datetime.strptime(
-                    components["end_date"], "%Y%m%d"
-                )
+                components["end_date"] = _parse_yyyymmdd(components["end_date"])
             if "start_year_doy" in components:
-                components["start_date"] = datetime.strptime(
-                    components.pop("start_year_doy"), "%Y_%j"
+                components["start_date"] = _parse_year_doy(
+                    components.pop("start_year_doy")
                 )
             if "end_year_doy" in components:
-                components["end_date"] = datetime.strptime(
-                    components.pop("end_year_doy"), "%Y_%j"
-                )
+                components["end_date"] = _parse_year_doy(components.pop("end_year_doy"))
             if "start_year" in components:
                 components["start_date"] = datetime(
                     int(components.pop("start_year")), 1, 1
@@ -623,6 +944,54 @@ class SPICEFilePath(ImapFilePath):
             components["end_date"] = None
         return components
 
+    @staticmethod
+    def _probe_match(filename: str) -> re.Match | None:
+        """Check whether a filename matches any SPICE pattern.
+
+        This only runs the regex for the file extension, without building the
+        components or validating dates, so it is a cheap test for SPICE files.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file, without any parent directories.
+
+        Returns
+        -------
+        match : re.Match | None
+            The match of the combined regex, or None if no pattern matches.
+        """
+        extension = filename.rpartition(".")[2]
+        if extension not in SPICEFilePath._spice_regexes_by_extension:
+            return None
+        return SPICEFilePath._spice_regexes_by_extension[extension][0].match(filename)
+
+    @staticmethod
+    def _match_spice_filename(filename: str) -> dict | None:
+        """Match a filename against the valid SPICE patterns for its extension.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file, without any parent directories.
+
+        Returns
+        -------
+        components : dict | None
+            The named groups of the first matching pattern, or None if no pattern
+            matches.
+        """
+        m = SPICEFilePath._probe_match(filename)
+        if m is None:
+            return None
+        _, branch_groups = SPICEFilePath._spice_regexes_by_extension[
+            filename.rpartition(".")[2]
+        ]
+        return {
+            name: m.group(prefixed_name)
+            for prefixed_name, name in branch_groups[m.lastgroup]
+        }
+
     @staticmethod
     def extract_filename_components(filename: Path | str) -> dict | None:
         """Extract all components from filename.
@@ -646,14 +1015,28 @@ class SPICEFilePath(ImapFilePath):
         components : dict
             Dictionary containing components.
         """
-        filename = Path(filename)
-        for regex in SPICEFilePath.valid_spice_regexes:
-            m = regex.match(filename.name)
-            if m is not None:
-                spice_metadata = SPICEFilePath._spice_parts_handler(m.groupdict())
-                # Add the extension to the metadata
-                spice_metadata["extension"] = filename.suffix[1:]
-                return spice_metadata
+        return _cached_components(SPICEFilePath._parse_filename_components, filename)
+
+    @staticmethod
+    def _parse_filename_components(filename: str) -> dict:
+        """Parse the components of a filename.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file, without any parent directories.
+
+        Returns
+        -------
+        components : dict
+            Dictionary containing components.
+        """
+        components = SPICEFilePath._match_spice_filename(filename)
+        if components is not None:
+            spice_metadata = SPICEFilePath._spice_parts_handler(components)
+            # Add the extension to the metadata
+            spice_metadata["extension"] = filename.rpartition(".")[2]
+            return spice_metadata
 
         # Error if no match found to accepted types
         raise SPICEFilePath.InvalidSPICEFileError(
@@ -667,6 +1050,18 @@ class SPICEFilePath(ImapFilePath):
 class AncillaryFilePath(ImapFilePath):
     """Class for building and validating filepaths for Ancillary files."""
 
+    __slots__ = (
+        "data_dir",
+        "descriptor",
+        "end_date",
+        "error_message",
+        "extension",
+        "instrument",
+        "mission",
+        "start_date",
+        "version",
+    )
+
     class InvalidAncillaryFileError(Exception):
         """Indicates a bad file type."""
 
@@ -701,11 +1096,11 @@ class AncillaryFilePath(ImapFilePath):
         filename : str | Path
             Ancillary data filename or file path.
         """
-        self.filename = Path(filename)
+        self._filename = filename
         self.data_dir = imap_data_access.config["DATA_DIR"]
 
         try:
-            split_filename = self.extract_filename_components(self.filename)
+            split_filename = self.extract_filename_components(filename)
         except ValueError as err:
             raise self.InvalidAncillaryFileError(
                 f"Invalid filename. Expected file to match format: "
@@ -789,47 +1184,42 @@ class AncillaryFilePath(ImapFilePath):
             Error message for specific missing attribute, or "" if the file name is
             valid.
         """
-        error_message = ""
-
-        if any(
-            attr is None or attr == ""
-            for attr in [
-                self.mission,
-                self.instrument,
-                self.descriptor,
-                self.version,
-                self.extension,
-            ]
+        errors = []
+
+        if not (
+            self.mission
+            and self.instrument
+            and self.descriptor
+            and self.version
+            and self.extension
         ):
-            error_message = (
+            errors.append(
                 f"Invalid filename, missing attribute. Filename "
                 f"convention is {imap_data_access.ANCILLARY_FILENAME_CONVENTION} \n"
             )
         if self.mission != "imap":
-            error_message += f"Invalid mission {self.mission}. Please use imap \n"
+            errors.append(f"Invalid mission {self.mission}. Please use imap \n")
 
         if self.instrument not in imap_data_access.VALID_INSTRUMENTS:
-            error_message += (
+            errors.append(
                 f"Invalid instrument {self.instrument}. Please choose from "
-                f"{imap_data_access.VALID_INSTRUMENTS} \n"
+                f"{sorted(imap_data_access.VALID_INSTRUMENTS)} \n"
             )
 
         if self.extension not in imap_data_access.VALID_ANCILLARY_FILE_EXTENSION:
-            error_message += (
+            errors.append(
                 f"Invalid extension. Extension should be one of "
-                f"{imap_data_access.VALID_ANCILLARY_FILE_EXTENSION}.\n"
+                f"{sorted(imap_data_access.VALID_ANCILLARY_FILE_EXTENSION)}.\n"
             )
 
-        if not ScienceFilePath.is_valid_date(self.start_date):
-            error_message += "Invalid start date format. Please use YYYYMMDD format. \n"
+        if not self.is_valid_date(self.start_date):
+            errors.append("Invalid start date format. Please use YYYYMMDD format. \n")
 
         if self.end_date:
-            if not ScienceFilePath.is_valid_date(self.end_date):
-                error_message += (
-                    "Invalid end date format. Please use YYYYMMDD format. \n"
-                )
+            if not self.is_valid_date(self.end_date):
+                errors.append("Invalid end date format. Please use YYYYMMDD format. \n")
 
-        return error_message
+        return "".join(errors)
 
     def construct_path(self) -> Path:
         """Construct valid path from class variables and data_dir.
@@ -844,13 +1234,12 @@ class AncillaryFilePath(ImapFilePath):
         Path
             Upload path
         """
-        upload_path = Path(
-            f"{self.mission}/ancillary/{self.instrument}/{self.filename}"
+        upload_path = (
+            f"{self.mission}/ancillary/{self.instrument}/{_basename(self._filename)}"
         )
         if self.data_dir:
-            upload_path = self.data_dir / upload_path
-
-        return upload_path
+            return Path(self.data_dir, upload_path)
+        return Path(upload_path)
 
     @staticmethod
     def extract_filename_components(filename: str | Path) -> dict:
@@ -874,21 +1263,32 @@ class AncillaryFilePath(ImapFilePath):
         components : dict
             Dictionary containing components.
         """
-        # Pipe these together for optional matching in the regex below
-        extension_regex = "|".join(imap_data_access.VALID_ANCILLARY_FILE_EXTENSION)
-        pattern = (
-            r"^(?P<mission>imap)_"
-            r"(?P<instrument>[^_]+)_"
-            r"(?P<descriptor>[^_]+)_"
-            r"(?P<start_date>\d{8})"
-            r"(_(?P<end_date>\d{8}))?"  # Optional end_date
-            r"_(?P<version>v\d{3})"
-            rf"\.(?P<extension>{extension_regex})$"
+        return _cached_components(
+            AncillaryFilePath._parse_filename_components, filename
         )
-        if isinstance(filename, Path):
-            filename = filename.name
 
-        match = re.match(pattern, filename)
+    @staticmethod
+    def _parse_filename_components(filename: str) -> dict:
+        """Parse the components of a filename.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file, without any parent directories.
+
+        Returns
+        -------
+        components : dict
+            Dictionary containing components.
+        """
+        # Cheap string checks rule out most other files before running the regex
+        match = None
+        if (
+            filename.startswith("imap_")
+            and filename.rpartition(".")[2]
+            in imap_data_access.VALID_ANCILLARY_FILE_EXTENSION
+        ):
+            match = _ANCILLARY_RE.match(filename)
         if match is None:
             raise AncillaryFilePath.InvalidAncillaryFileError(
                 f"Filename {filename} does not match expected pattern: "
@@ -896,4 +1296,14 @@ class AncillaryFilePath(ImapFilePath):
             )
 
         components = match.groupdict()
+        components["instrument"] = sys.intern(components["instrument"])
         return components
+
+
+# Errors raised by each file path class for a filename in the wrong format, bound
+# once here rather than looked up on the classes for every file
+_INVALID_FILE_ERRORS = (
+    SPICEFilePath.InvalidSPICEFileError,
+    ScienceFilePath.InvalidScienceFileError,
+    AncillaryFilePath.InvalidAncillaryFileError,
+)
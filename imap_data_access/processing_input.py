@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -63,14 +63,23 @@ class ProcessingInput(ABC):
         A descriptor for the file, for example, "burst" or "cal".
     """
 
-    filename_list: list[str] = None
-    imap_file_paths: list[ImapFilePath] = None
-    input_type: ProcessingInputType = None
+    __slots__ = (
+        "data_type",
+        "descriptor",
+        "filename_list",
+        "imap_file_paths",
+        "input_type",
+        "source",
+    )
+
+    filename_list: list[str]
+    imap_file_paths: list[ImapFilePath]
+    input_type: ProcessingInputType
     # Following three are retrieved from dependency check.
     # But they can also come from the filename.
-    source: str = field(init=False)
-    data_type: str = field(init=False)  # should be data level or "ancillary" or "spice"
-    descriptor: str = field(init=False)
+    source: str
+    data_type: str  # should be data level or "ancillary" or "spice"
+    descriptor: str
 
     def __init__(self, *args):
         """Initialize using a list of filepaths and sets the attributes of the class.
@@ -119,29 +128,31 @@ class ProcessingInput(ABC):
         This sets source, datatype, descriptor, and file_obj_list attributes.
         """
         # For science and ancillary files
-        source = set()
-        data_type = set()
-        descriptor = set()
+        error_message = (
+            "All files must have the same source, data type, and descriptor."
+        )
+        attributes = None
         file_obj_list = []
+        path_class = InputTypePathMapper[self.input_type.name].value
+        is_science = self.input_type == ProcessingInputType.SCIENCE_FILE
         for file in self.filename_list:
-            path_validator = InputTypePathMapper[self.input_type.name].value(file)
-
-            source.add(path_validator.instrument)
-            if self.input_type == ProcessingInputType.SCIENCE_FILE:
-                data_type.add(path_validator.data_level)
-            else:
-                data_type.add(self.input_type.value)
-            descriptor.add(path_validator.descriptor)
+            path_validator = path_class(file)
+            file_attributes = (
+                path_validator.instrument,
+                path_validator.data_level if is_science else self.input_type.value,
+                path_validator.descriptor,
+            )
+            # Every file is compared to the first, stopping at the first mismatch
+            if attributes is None:
+                attributes = file_attributes
+            elif file_attributes != attributes:
+                raise ValueError(error_message)
             file_obj_list.append(path_validator)
 
-        if len(source) != 1 or len(data_type) != 1 or len(descriptor) != 1:
-            raise ValueError(
-                "All files must have the same source, data type, and descriptor."
-            )
+        if attributes is None:
+            raise ValueError(error_message)
 
-        self.source = source.pop()
-        self.data_type = data_type.pop()
-        self.descriptor = descriptor.pop()
+        self.source, self.data_type, self.descriptor = attributes
         self.imap_file_paths = file_obj_list
 
     def construct_json_output(self):
@@ -160,6 +171,8 @@ class ScienceInput(ProcessingInput):
      and descriptor.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args):
         """Set the processing type to ScienceFile and then calls super().
 
@@ -186,8 +199,7 @@ class ScienceInput(ProcessingInput):
         # files are currently assumed to cover exactly 24 hours.
         start_time = None
         end_time = None
-        for file in self.filename_list:
-            filepath = ScienceFilePath(file)
+        for filepath in self.imap_file_paths:
             date = datetime.strptime(filepath.start_date, "%Y%m%d")
             if start_time is None or date < start_time:
                 start_time = date
@@ -203,6 +215,8 @@ class AncillaryInput(ProcessingInput):
     and descriptor.
     """
 
+    __slots__ = ()
+
     # Can contain multiple ancillary files - should have the same descriptor
     def __init__(self, *args):
         """Set the processing type to AncillaryFile and then calls super().
@@ -230,8 +244,7 @@ class AncillaryInput(ProcessingInput):
         """
         start_time = None
         end_time = None
-        for file in self.filename_list:
-            filepath = AncillaryFilePath(file)
+        for filepath in self.imap_file_paths:
             startdate = datetime.strptime(filepath.start_date, "%Y%m%d")
             if filepath.end_date is not None:
                 enddate = datetime.strptime(filepath.end_date, "%Y%m%d")
@@ -268,6 +281,8 @@ class AncillaryInput(ProcessingInput):
 class SPICEInput(ProcessingInput):
     """SPICE file subclass for ProcessingInput."""
 
+    __slots__ = ()
+
     def __init__(self, *args) -> None:
         """Initialize the attributes from the SPICE file name.
 
@@ -297,6 +312,14 @@ class SPICEInput(ProcessingInput):
         pass
 
 
+# Serialized input type values mapped to the ProcessingInput class to create
+_INPUT_CLASS_BY_TYPE = {
+    ProcessingInputType.SCIENCE_FILE.value: ScienceInput,
+    ProcessingInputType.ANCILLARY_FILE.value: AncillaryInput,
+    ProcessingInputType.SPICE_FILE.value: SPICEInput,
+}
+
+
 @dataclass
 class ProcessingInputCollection:
     """Describe a collection of ProcessingInput objects.
@@ -313,6 +336,8 @@ class ProcessingInputCollection:
         A list of ProcessingInput objects.
     """
 
+    __slots__ = ("processing_input",)
+
     processing_input: list[ProcessingInput]
 
     def __init__(self, *args: ProcessingInput) -> None:
@@ -348,11 +373,10 @@ class ProcessingInputCollection:
         str
             A string of JSON-formatted serialized output.
         """
-        json_out = []
-        for file in self.processing_input:
-            json_out.append(file.construct_json_output())
-
-        return json.dumps(json_out)
+        json_out = [file.construct_json_output() for file in self.processing_input]
+        # Compact separators keep the string short, as it is often passed on to
+        # other processes as a command line argument
+        return json.dumps(json_out, separators=(",", ":"))
 
     def deserialize(self, json_input: str) -> None:
         """Deserialize JSON into the collection of ProcessingInput instances.
@@ -365,12 +389,9 @@ class ProcessingInputCollection:
         full_input = json.loads(json_input)
 
         for file_creator in full_input:
-            if file_creator["type"] == ProcessingInputType.SCIENCE_FILE.value:
-                self.add(ScienceInput(*file_creator["files"]))
-            elif file_creator["type"] == ProcessingInputType.ANCILLARY_FILE.value:
-                self.add(AncillaryInput(*file_creator["files"]))
-            elif file_creator["type"] == ProcessingInputType.SPICE_FILE.value:
-                self.add(SPICEInput(*file_creator["files"]))
+            input_class = _INPUT_CLASS_BY_TYPE.get(file_creator["type"])
+            if input_class is not None:
+                self.add(input_class(*file_creator["files"]))
 
     def get_science_inputs(self) -> list[ProcessingInput]:
         """Return just the science files from the collection.
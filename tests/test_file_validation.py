@@ -10,6 +10,7 @@ from imap_data_access.file_validation import (
     AncillaryFilePath,
     ScienceFilePath,
     SPICEFilePath,
+    generate_imap_file_path,
 )
 
 
@@ -60,15 +61,41 @@ def test_extract_filename_components():
         ScienceFilePath.extract_filename_components(valid_filepath) == expected_output
     )
 
+    # A string path with a parent directory is handled the same way
+    assert (
+        ScienceFilePath.extract_filename_components(str(valid_filepath))
+        == expected_output
+    )
+    assert (
+        ScienceFilePath.extract_filename_components(
+            "C:\\test\\imap_mag_l1a_burst_20210101_v001.cdf"
+        )
+        == expected_output
+    )
+
     invalid_ext = "imap_mag_l1a_burst_20210101_v001.txt"
     with pytest.raises(ScienceFilePath.InvalidScienceFileError):
         ScienceFilePath.extract_filename_components(invalid_ext)
 
+    # Modifying the returned components does not affect later calls
+    components = ScienceFilePath.extract_filename_components(valid_filepath)
+    components["instrument"] = "swe"
+    assert (
+        ScienceFilePath.extract_filename_components(valid_filepath) == expected_output
+    )
+
+    # Trailing characters after the extension are not allowed
+    with pytest.raises(ScienceFilePath.InvalidScienceFileError):
+        ScienceFilePath.extract_filename_components(
+            "imap_mag_l1a_burst_20210101_v001.cdf\n"
+        )
+
 
 def test_construct_sciencefilepathmanager():
     """Tests that the ``ScienceFilePath`` class constructs a valid filename."""
     valid_filename = "imap_mag_l1a_burst_20210101_v001.cdf"
     sfm = ScienceFilePath(valid_filename)
+    assert sfm.filename == Path(valid_filename)
     assert sfm.mission == "imap"
     assert sfm.instrument == "mag"
     assert sfm.data_level == "l1a"
@@ -101,6 +128,7 @@ def test_construct_sciencefilepathmanager():
     # good path with an extra "test" directory
     valid_filepath = Path("/test/imap_mag_l1a_burst_20210101_v001.cdf")
     sfm = ScienceFilePath(valid_filepath)
+    assert sfm.filename == valid_filepath
 
     assert sfm.instrument == "mag"
     assert sfm.data_level == "l1a"
@@ -111,6 +139,26 @@ def test_construct_sciencefilepathmanager():
     assert sfm.extension == "cdf"
 
 
+def test_validate_filename_bad_date_format():
+    """Tests that a malformed date is reported in the error message."""
+    sfm = ScienceFilePath("imap_mag_l1a_burst_20210101_v001.cdf")
+    sfm.start_date = "2021"
+    assert "Invalid start date format" in sfm.validate_filename()
+
+    afm = AncillaryFilePath("imap_mag_l1b-cal_20210101_20210102_v001.cdf")
+    afm.end_date = "2021-01"
+    assert "Invalid end date format" in afm.validate_filename()
+
+
+def test_invalid_filename_with_plain_set_constants(monkeypatch):
+    """Tests that invalid names still raise when the valid values are plain sets."""
+    monkeypatch.setattr(imap_data_access, "VALID_INSTRUMENTS", {"mag", "swe"})
+    with pytest.raises(ScienceFilePath.InvalidScienceFileError, match="mag"):
+        ScienceFilePath("imap_hit_l1a_burst_20210101_v001.cdf")
+    with pytest.raises(AncillaryFilePath.InvalidAncillaryFileError, match="swe"):
+        AncillaryFilePath("imap_hit_l1b-cal_20210101_v001.cdf")
+
+
 def test_is_valid_date():
     """Tests the ``is_valid_date`` method."""
     valid_date = "20210101"
@@ -125,6 +173,15 @@ def test_is_valid_date():
     invalid_date = "2021010"
     assert not ScienceFilePath.is_valid_date(invalid_date)
 
+    # Leap days
+    assert ScienceFilePath.is_valid_date("20240229")
+    assert ScienceFilePath.is_valid_date("20000229")
+    assert not ScienceFilePath.is_valid_date("20250229")
+    assert not ScienceFilePath.is_valid_date("21000229")
+
+    invalid_date = "20211301"
+    assert not ScienceFilePath.is_valid_date(invalid_date)
+
 
 def test_construct_upload_path():
     """Tests the ``construct_path`` method."""
@@ -136,6 +193,10 @@ def test_construct_upload_path():
 
     assert sfm.construct_path() == expected_output
 
+    # Parent directories of the input file are not part of the upload path
+    sfm = ScienceFilePath(Path("/test") / valid_filename)
+    assert sfm.construct_path() == expected_output
+
 
 def test_generate_from_inputs():
     """Tests the ``generate_from_inputs`` method."""
@@ -183,9 +244,23 @@ def test_spice_file_path():
         "imap/spice/ck/imap_1000_100_1000_100_01.ap.bc"
     )
 
+    # Parent directories of the input file are not part of the upload path
+    file_path = SPICEFilePath(Path("/test/imap_1000_100_1000_100_01.ap.bc"))
+    assert file_path.construct_path() == imap_data_access.config["DATA_DIR"] / Path(
+        "imap/spice/ck/imap_1000_100_1000_100_01.ap.bc"
+    )
+
     # Test a bad file extension too
     with pytest.raises(SPICEFilePath.InvalidSPICEFileError):
         SPICEFilePath("test.txt")
+    # A valid SPICE name with another extension appended is not a SPICE file
+    with pytest.raises(SPICEFilePath.InvalidSPICEFileError):
+        SPICEFilePath("naif0012.tls.bak")
+    # The public regexes agree with how files are matched
+    assert not any(
+        r.match("naif0012.tls.bak") for r in SPICEFilePath.valid_spice_regexes
+    )
+    assert any(r.match("naif0012.tls") for r in SPICEFilePath.valid_spice_regexes)
 
     # Test that spin and repoint goes into their own directories
     spin_file_path = SPICEFilePath("imap_2025_122_2025_122_01.spin.csv")
@@ -326,6 +401,12 @@ def test_spice_invalid_dates():
     with pytest.raises(SPICEFilePath.InvalidSPICEFileError):
         SPICEFilePath("imap_2025_032_2025_410_003.ah.bc")
 
+    # Day 366 only exists in leap years
+    with pytest.raises(SPICEFilePath.InvalidSPICEFileError):
+        SPICEFilePath("imap_2025_032_2025_366_003.ah.bc")
+    file_path = SPICEFilePath("imap_2024_032_2024_366_003.ah.bc")
+    assert file_path.spice_metadata["end_date"] == datetime(2024, 12, 31)
+
     # Ensure dates are valid (Month 13??)
     with pytest.raises(SPICEFilePath.InvalidSPICEFileError):
         SPICEFilePath("imap_90days_20251320_20260220_v01.bsp")
@@ -431,3 +512,38 @@ def test_ancillary_file_path():
     ancillary_file = AncillaryFilePath(anc_file)
     assert ancillary_file.instrument == "mag"
     assert ancillary_file.end_date == "20210102"
+
+
+def test_generate_imap_file_path():
+    """Tests that ``generate_imap_file_path`` returns the right file path type."""
+    assert isinstance(
+        generate_imap_file_path("imap_mag_l1a_burst_20210101_v001.cdf"),
+        ScienceFilePath,
+    )
+    assert isinstance(
+        generate_imap_file_path("imap_mag_l0_raw_20210101_v001.pkts"),
+        ScienceFilePath,
+    )
+    assert isinstance(
+        generate_imap_file_path("imap_2025_122_2025_122_01.spin.csv"),
+        SPICEFilePath,
+    )
+    assert isinstance(generate_imap_file_path("naif0012.tls"), SPICEFilePath)
+    assert isinstance(generate_imap_file_path("IMAP_2025_005_e01.mk"), SPICEFilePath)
+    # Ancillary files can share an extension with both SPICE and Science files
+    assert isinstance(
+        generate_imap_file_path("imap_mag_test_20210101_v001.csv"),
+        AncillaryFilePath,
+    )
+    assert isinstance(
+        generate_imap_file_path("imap_mag_l1b-cal_20250101_v001.cdf"),
+        AncillaryFilePath,
+    )
+
+    # The ancillary error is always reported as the cause
+    for filename in ["test.txt", "NAIF0012.TLS", "imap_2025_032_2025_410_003.ah.bc"]:
+        with pytest.raises(ValueError, match="Invalid file type") as excinfo:
+            generate_imap_file_path(filename)
+        assert isinstance(
+            excinfo.value.__cause__, AncillaryFilePath.InvalidAncillaryFileError
+        )
@@ -146,6 +146,16 @@ def test_get_time_range():
     assert start == datetime.strptime("20250101", "%Y%m%d")
     assert end == datetime.strptime("20250104", "%Y%m%d")
 
+    science = processing_input.ScienceInput(
+        "imap_mag_l1a_norm-magi_20240312_v000.cdf",
+        "imap_mag_l1a_norm-magi_20240310_v000.cdf",
+    )
+
+    start, end = science.get_time_range()
+
+    assert start == datetime(2024, 3, 10)
+    assert end == datetime(2024, 3, 12)
+
 
 def test_get_file_paths():
     # This example is fake example where we are processing HIT L2